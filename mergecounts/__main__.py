@@ -5,9 +5,9 @@ import logging
 from logzero import logger
 import pandas as pd
 
-from . import concordance, metadata, recursive, sequential, utils
+from . import concordance, metadata, recursive, utils
 
-SUBCOMMANDS = [concordance, metadata, recursive, sequential]
+SUBCOMMANDS = [concordance, metadata, recursive]
 
 
 def get_args() -> argparse.Namespace:
@@ -75,12 +75,28 @@ def run() -> None:
         output_file = args.output_file
 
     logger.info("Writing results to %s.", output_file)
-    if args.output_file_type == "tsv":
-        result.to_csv(output_file, sep="\t")
-    elif args.output_file_type == "csv":
-        result.to_csv(output_file)
+    if args.output_file_type in ("tsv", "csv"):
+        delimiter = "\t" if args.output_file_type == "tsv" else ","
+        if args.legacy_csv:
+            result.to_csv(output_file, sep=delimiter)
+        else:
+            utils.matrix.write_delimited(result, output_file, delimiter)
     elif args.output_file_type == "hdf":
-        result.to_hdf(output_file, "counts")
+        # the fixed format stores the dense matrix as a single (chunked, compressed)
+        # array; mode="w" avoids the file growing when an existing output is replaced.
+        result.to_hdf(
+            output_file,
+            key="counts",
+            mode="w",
+            format="fixed",
+            complib="blosc:zstd",
+            complevel=3,
+        )
+    elif args.output_file_type == "parquet":
+        result.to_parquet(output_file, engine="pyarrow", compression="zstd")
+    elif args.output_file_type == "feather":
+        # feather cannot serialize a non-default index, so write it as a column.
+        result.reset_index().to_feather(output_file, compression="zstd")
     else:
         raise ValueError(
             f"Unhandled output file type: {args.output_file_type}. Please contact the author."
@@ -50,5 +50,10 @@ def run(args: argparse.Namespace) -> None:
         args.cache,
         enable_filesystem_caching=args.developer_mode,
     )
-    dfs = utils.matrix.read_counts(files, limit_inputs=args.limit_inputs)
-    utils.matrix.concordance_test(dfs)
+    utils.matrix.concordance_test(
+        files,
+        limit_inputs=args.limit_inputs,
+        io_threads=args.io_threads,
+        count_dtype=args.count_dtype,
+        cache_counts=args.cache_counts,
+    )
@@ -30,4 +30,4 @@ def run(args: argparse.Namespace) -> pd.DataFrame:
     Returns:
         pd.DataFrame: the resulting `pandas.DataFrame`.
     """
-    return utils.matrix.download_and_merge_counts(args, merge_mode="recursive")
+    return utils.matrix.download_and_merge_counts(args)
@@ -16,9 +16,56 @@ def get_common_args() -> argparse.ArgumentParser:
         "dxids", help="DNAnexus file ids to generate the matrix with.", nargs="+"
     )
     common.add_argument("-n", "--ncpus", type=int, default=multiprocessing.cpu_count())
+    common.add_argument(
+        "--engine",
+        help="Library used to read and merge the counts files. The polars engine "
+        + "requires the `polars` extra to be installed.",
+        choices=["pandas", "polars"],
+        default="pandas",
+    )
+    common.add_argument(
+        "--io-threads",
+        help="Number of threads used to read counts files into memory.",
+        type=int,
+        default=multiprocessing.cpu_count(),
+    )
+    common.add_argument(
+        "--count-dtype",
+        help="Integer type used to hold the counts in memory. int32 halves the memory "
+        + "footprint and is plenty for HTSeq counts; use int64 if any count exceeds 2^31-1.",
+        choices=["int32", "int64"],
+        default="int32",
+    )
+    common.add_argument(
+        "--cache-counts",
+        help="Cache each parsed counts file as parquet next to the original, which speeds "
+        + "up subsequent runs considerably. Only useful with `--developer-mode`, since "
+        + "downloads are deleted at the end of the run otherwise.",
+        dest="cache_counts",
+        default=False,
+        action="store_true",
+    )
+    common.add_argument(
+        "--no-cache-counts",
+        help="Do not cache parsed counts files (default).",
+        dest="cache_counts",
+        action="store_false",
+    )
     common.add_argument("-o", "--output-file", type=str, default=None)
     common.add_argument(
-        "-t", "--output-file-type", choices=["hdf", "csv", "tsv"], default="tsv"
+        "-t",
+        "--output-file-type",
+        help="Format of the output file. Binary formats (parquet, feather, hdf) are "
+        + "much faster to write and read than the plain text formats (tsv, csv).",
+        choices=["hdf", "csv", "tsv", "parquet", "feather"],
+        default="parquet",
+    )
+    common.add_argument(
+        "--legacy-csv",
+        help="Write tsv/csv output with pandas instead of pyarrow. This is much slower, "
+        + "but the output is byte-for-byte identical to older versions of this tool.",
+        default=False,
+        action="store_true",
     )
     common.add_argument(
         "--developer-mode",
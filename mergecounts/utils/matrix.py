@@ -1,65 +1,189 @@
 """Matrix utilities for the merge-counts command line tool."""
 
 import argparse
+import csv
+import functools
+import io
 import math
+import os
+import random
 import shutil
+import sys
 import tempfile
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, NamedTuple, Optional, List, Tuple
 
 import tqdm
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv, parquet as pq
 from logzero import logger
 from . import cache as _cache, dx, errors
 
+try:
+    import polars as pl
+except ImportError:
+    # polars is an optional dependency, only needed for `--engine polars`.
+    pl = None
+
+try:
+    from . import scanner
+except ImportError:
+    # numba is an optional dependency, pyarrow's CSV reader is used without it.
+    scanner = None  # type: ignore
+
 ######################
 # Merging DataFrames #
 ######################
 
 
-def join_dataframes_sequentially(dfs: List[pd.DataFrame]) -> pd.DataFrame:
-    """Merges dataframes based on a sequential approach. This method takes much
-    longer than the recursive approach and should not be used other than as a sanity
-    check for the recursive algorithm.
+def _progress_bar(iterable=None, total: Optional[int] = None, **kwargs) -> tqdm.tqdm:
+    """Creates a `tqdm` progress bar that redraws at most ~200 times (and no more
+    than twice a second) however many items it tracks, and stays silent when stderr
+    is not a terminal, e.g. when the output is redirected to a log file.
 
     Args:
-        dfs (List[pd.DataFrame]): Unmerged dataframes read directly from files.
+        iterable (Iterable, optional): iterable to decorate. Defaults to None.
+        total (int, optional): number of expected iterations. Defaults to the length
+                               of `iterable`.
 
-    Raises:
-        ValueError: must contain at least one count file to merge.
-        RuntimeError: sanity check to ensure the dataframe shape matches what is expected.
+    Returns:
+        tqdm.tqdm: the progress bar.
+    """
+
+    if total is None:
+        total = len(iterable)  # type: ignore
+
+    return tqdm.tqdm(
+        iterable,
+        total=total,
+        miniters=max(1, total // 200),
+        mininterval=0.5,
+        disable=not sys.stderr.isatty(),
+        **kwargs,
+    )
+
+
+def _share_index(dfs: List[pd.DataFrame]) -> bool:
+    """Checks whether every dataframe has the same index (same values in the same
+    order) as the first one. Dataframes from `read_counts` share the index object
+    itself, so the identity check usually settles it; otherwise, the length is compared
+    before the full (short-circuiting) comparison of the values.
+
+    Args:
+        dfs (List[pd.DataFrame]): dataframes to check.
 
     Returns:
-        pd.DataFrame: a single, merged dataframe for all counts.
+        bool: whether all of the dataframes can be stacked without aligning them.
     """
 
-    # don't modify the original dfs object.
-    dfs = dfs.copy()
+    reference_index = dfs[0].index
+    for dataframe in dfs[1:]:
+        index = dataframe.index
+        if index is reference_index:
+            continue
+        if len(index) != len(reference_index) or not index.equals(reference_index):
+            return False
+    return True
 
-    num_dfs = len(dfs)
-    if num_dfs <= 0:
-        raise ValueError("Must contain at least one count file to merge.")
 
-    expected_result_shape = (dfs[0].shape[0], num_dfs)
-    result = None
+def _stack_dataframes(
+    dfs: List[pd.DataFrame], expected_shape: Tuple[int, int]
+) -> pd.DataFrame:
+    """Stacks dataframes that share the exact same index side by side. Because no
+    index alignment is needed, the counts are copied straight into a preallocated
+    array and wrapped into a `pandas.DataFrame` only once at the end.
+
+    Args:
+        dfs (List[pd.DataFrame]): dataframes sharing the same index (see `_share_index`).
+        expected_shape (Tuple[int, int]): expected (rows, columns) of the result.
 
-    for dataframe in tqdm.tqdm(dfs, desc="Merging sequentially"):
-        if result is None:
-            result = dataframe
-        else:
-            result = result.merge(
-                dataframe, how="outer", left_index=True, right_index=True
-            )
+    Raises:
+        RuntimeError: sanity check to ensure the matrix shape matches what is expected.
 
-    if not result.shape == expected_result_shape:  # type: ignore
+    Returns:
+        pd.DataFrame: a single dataframe containing all of the columns.
+    """
+
+    index = dfs[0].index
+    columns = [column for dataframe in dfs for column in dataframe.columns]
+    dtype = np.result_type(*[dtype for dataframe in dfs for dtype in dataframe.dtypes])
+
+    out = np.empty((len(index), len(columns)), dtype=dtype)
+    offset = 0
+    for dataframe in _progress_bar(dfs, desc="Stacking counts"):
+        width = dataframe.shape[1]
+        out[:, offset : offset + width] = dataframe.to_numpy()
+        offset += width
+
+    # check the raw array before paying for the `pandas.DataFrame` construction.
+    (num_rows, num_columns) = out.shape
+    if num_rows != expected_shape[0] or num_columns != expected_shape[1]:
         errors.raise_error(
-            f"Output matrix shape ({result.shape}) does not match expected shape ({expected_result_shape})!"  # type: ignore
+            f"Output matrix shape ({out.shape}) does not match expected shape ({expected_shape})!"
         )
 
-    return result
+    return pd.DataFrame(out, index=index, columns=columns)
+
+
+def _merge_dataframes_recursively(
+    dfs: List[pd.DataFrame], split_every: int = 8
+) -> pd.DataFrame:
+    """Outer-joins dataframes as a tree reduction: at each level, groups of
+    `split_every` dataframes are concatenated side by side (computing the union of
+    their indices once per group) until only a single dataframe remains.
+
+    Args:
+        dfs (List[pd.DataFrame]): dataframes to merge.
+        split_every (int, optional): number of dataframes joined per group. Defaults to 8.
+
+    Raises:
+        RuntimeError: sanity check to ensure the math is correct.
+
+    Returns:
+        pd.DataFrame: a single, merged dataframe.
+    """
+
+    # Each iteration, the number of dataframes gets cut by a factor of `split_every`.
+    # During some iterations, the last group will be smaller than the others (or be a
+    # single dataframe). Thus, we can calculate the number of joins by following this
+    # pattern.
+    num_dfs = len(dfs)
+    num_iterations_needed = 0
+    while num_dfs > 1:
+        # ceil rounds up to account for the last, smaller group.
+        amt = math.ceil(num_dfs / split_every)
+        num_iterations_needed += amt
+        num_dfs = amt
+
+    with _progress_bar(total=num_iterations_needed, desc="Merging recursively") as pbar:
+        while len(dfs) > 1:
+            merged_dfs = []
+            for i in range(0, len(dfs), split_every):
+                # `sort=True` matches the key order of an outer `DataFrame.merge`.
+                merged_dfs.append(
+                    pd.concat(
+                        dfs[i : i + split_every],
+                        axis=1,
+                        join="outer",
+                        sort=True,
+                        copy=False,
+                    )
+                )
+                pbar.update()
+            dfs = merged_dfs
+
+    if not len(dfs) == 1:
+        errors.raise_error("Math was incorrect!")
+
+    return dfs[0]
 
 
 def join_dataframes_recursively(dfs: List[pd.DataFrame]) -> pd.DataFrame:
-    """Merges dataframes based on a divide and conquer strategy.
+    """Merges dataframes based on a divide and conquer strategy. When every dataframe
+    shares the same gene index (the common case, see `read_counts`), the merge is
+    skipped entirely and the counts are stacked into a single matrix instead.
 
     Args:
         dfs (List[pd.DataFrame]): Unmerged dataframes read directly from files.
@@ -73,72 +197,232 @@ def join_dataframes_recursively(dfs: List[pd.DataFrame]) -> pd.DataFrame:
         pd.DataFrame: a single, merged dataframe for all counts.
     """
 
-    # don't modify the original dfs object.
-    dfs = dfs.copy()
+    # take the list by value so callers (e.g. `concordance_test`) can safely reuse it.
+    dfs = list(dfs)
 
     num_dfs = len(dfs)
     if num_dfs <= 0:
         raise ValueError("Must contain at least one count file to merge.")
 
-    expected_result_shape = (dfs[0].shape[0], num_dfs)
+    expected_result_shape = (
+        dfs[0].shape[0],
+        sum(dataframe.shape[1] for dataframe in dfs),
+    )
 
-    # Each iteration, the number of dataframes gets cut by 2.
-    # During some iterations, there will be one dataframe left over without a mate to merge
-    # with. Thus, we can calculate the number of mergings by following this pattern.
-    num_iterations_needed = 0
-    while num_dfs > 1:
-        # ceil rounds up to account for the one dataframe without a mate case.
-        amt = math.ceil(num_dfs / 2)
-        num_iterations_needed += amt
-        num_dfs = amt
+    if num_dfs == 1:
+        # nothing to merge, e.g. every file was read into a single matrix.
+        result = dfs[0]
+    elif _share_index(dfs):
+        logger.debug("All dataframes share the same gene index, stacking directly.")
+        result = _stack_dataframes(dfs, expected_shape=expected_result_shape)
+    else:
+        logger.debug("Gene indices differ between dataframes, merging recursively.")
+        result = _merge_dataframes_recursively(dfs)
+
+        # only the merge can grow the matrix (when indices differ), the stacked
+        # matrix is checked before it is wrapped in a dataframe.
+        (num_rows, num_columns) = result.shape
+        if (
+            num_rows != expected_result_shape[0]
+            or num_columns != expected_result_shape[1]
+        ):
+            errors.raise_error(
+                f"Output matrix shape ({result.shape}) does not match expected shape ({expected_result_shape})!"
+            )
 
-    pbar = tqdm.tqdm(total=num_iterations_needed, desc="Merging recursively")
-    while len(dfs) > 1:
-        merged_dfs = []
-        while len(dfs) > 0:
-            one = dfs.pop(0)
-            if len(dfs) == 0:
-                # expected case where one df may be left alone on the stack
-                merged_dfs.append(one)
-            else:
-                two = dfs.pop(0)
-                merged = one.merge(two, how="outer", left_index=True, right_index=True)
-                merged_dfs.append(merged)
-            pbar.update()
-        dfs = merged_dfs
+    # `read_counts` returns the samples sorted, so this is usually already the case.
+    if not result.columns.is_monotonic_increasing:
+        result = result[sorted(result.columns.values)]
+
+    return result
 
-    if not len(dfs) == 1:
-        errors.raise_error("Math was incorrect!")
 
-    result = dfs[0]
-    result = result[sorted(result.columns.values)]
+def _read_counts_with_polars(counts: List[tuple]) -> "List[pl.DataFrame]":
+    """Reads counts files with polars, all of them in parallel. The counts are read as
+    int64, like `_read_counts_file` does, so they can be range checked before they are
+    narrowed to the requested dtype.
 
-    if not result.shape == expected_result_shape:
+    Args:
+        counts(List[tuple]): list of tuples containing (samplename, filename to open).
+
+    Raises:
+        RuntimeError: a file can't be parsed or is missing some counts.
+
+    Returns:
+        List[pl.DataFrame]: a (genes, counts) dataframe per file.
+    """
+
+    frames = [
+        pl.scan_csv(
+            filename,
+            separator="\t",
+            has_header=False,
+            # like pyarrow's CSV reader, quotes are just part of the gene name.
+            quote_char=None,
+            schema={"Gene Name": pl.Utf8, sample_name: pl.Int64},
+        )
+        # blank lines are read as rows of nulls.
+        .filter(pl.col("Gene Name").is_not_null())
+        for (sample_name, filename) in counts
+    ]
+    try:
+        frames = pl.collect_all(frames)
+    except (pl.exceptions.ComputeError, pl.exceptions.NoDataError) as err:
         errors.raise_error(
-            f"Output matrix shape ({result.shape}) does not match expected shape ({expected_result_shape})!"
+            "Unable to parse the counts files. Expected a gene name and a non-negative "
+            + f"integer count separated by a tab on every line ({err}).",
+            suggest_report=False,
         )
 
-    return result
+    for ((sample_name, filename), frame) in zip(counts, frames):
+        if frame.get_column(sample_name).null_count() > 0:
+            errors.raise_error(
+                f"Unable to parse {filename}. Expected a gene name and a non-negative "
+                + "integer count separated by a tab on every line.",
+                suggest_report=False,
+            )
+
+    return frames
+
+
+def join_counts_with_polars(
+    counts: List[tuple], limit_inputs: Optional[int] = None, count_dtype: str = "int32"
+) -> pd.DataFrame:
+    """Reads and outer-joins counts files with polars, which reads every file and
+    performs the whole multi-way join in parallel instead of building up intermediate
+    `pandas.DataFrame`s. The result is only converted to pandas at the very end.
+
+    Args:
+        counts(List[tuple]): list of tuples containing (samplename, filename to open).
+        limit_inputs(int, optional): For testing purposes only, take the first N files. Defaults to None.
+        count_dtype(str, optional): integer dtype to store the counts as. Defaults to "int32".
+
+    Raises:
+        RuntimeError: polars is not installed.
+        RuntimeError: a file does not contain the same genes as the others.
+        RuntimeError: a file contains counts that are negative or do not fit into `count_dtype`.
+
+    Returns:
+        pd.DataFrame: a single, merged dataframe for all counts.
+    """
+
+    if pl is None:
+        errors.raise_error(
+            "The polars engine requires polars to be installed. "
+            + 'Please run `pip install "stjudecloud-merge-counts[polars]"`.',
+            suggest_report=False,
+        )
+
+    if limit_inputs:
+        counts = counts[:limit_inputs]  # pylint: disable=bad-indentation
+
+    counts = sorted(counts, key=lambda count: count[0])
+    filenames = dict(counts)
+    frames = _read_counts_with_polars(counts)
+    result = pl.concat(frames, how="align")
 
+    # every file has a count for each of its genes, so the join introduces nulls only
+    # when some file is missing genes that others have.
+    for (sample_name, num_nulls) in zip(result.columns, result.null_count().row(0)):
+        if num_nulls > 0:
+            errors.raise_error(
+                f"Counts file {filenames[sample_name]} for {sample_name} does not "
+                + "contain the same genes as the other counts files.",
+                suggest_report=False,
+            )
+
+    # the same checks as `_read_counts_file`, for all of the samples at once.
+    samples = result.drop("Gene Name")
+    for (sample_name, lowest, highest) in zip(
+        samples.columns, samples.min().row(0), samples.max().row(0)
+    ):
+        if lowest < 0:
+            errors.raise_error(
+                f"Counts in {filenames[sample_name]} must be non-negative integers.",
+                suggest_report=False,
+            )
+        if highest > np.iinfo(count_dtype).max:
+            errors.raise_error(
+                f"Counts in {filenames[sample_name]} do not fit into {count_dtype}. "
+                + "Please rerun with `--count-dtype int64`.",
+                suggest_report=False,
+            )
 
-def concordance_test(dfs: List[pd.DataFrame]) -> None:
-    """Performs a concordance test between the sequential and recursive strategies
-    for merging matrices.
+    # aligning the frames sorts the genes, so restore the order of the first file
+    # to write the same matrix as the pandas engine.
+    order = pd.Index(result.get_column("Gene Name").to_numpy()).get_indexer(
+        frames[0].get_column("Gene Name").to_numpy()
+    )
+    result = result[order]
+
+    # build the dataframe with its final index and columns in one go rather than
+    # converting every column to pandas and then moving the genes into the index.
+    samples = result.drop("Gene Name").select(
+        pl.all().cast({"int32": pl.Int32, "int64": pl.Int64}[count_dtype])
+    )
+    return pd.DataFrame(
+        samples.to_numpy(order="fortran"),
+        index=pd.Index(result.get_column("Gene Name").to_numpy(), name="Gene Name"),
+        columns=samples.columns,
+        copy=False,
+    )
+
+
+def concordance_test(
+    counts: List[tuple],
+    limit_inputs: Optional[int] = None,
+    io_threads: Optional[int] = None,
+    count_dtype: str = "int32",
+    cache_counts: bool = False,
+) -> None:
+    """Performs a concordance test between the matrix built by `read_counts` and the
+    recursive strategy and a naive, sequential merge of one dataframe per counts file.
+    The files are parsed again, one at a time, for the latter, so it shares nothing
+    with the preallocated matrix. The sequential merge takes much longer and is only
+    kept here as a sanity check for the recursive strategy.
 
     Raises:
         AssertionError: if the matrices are not concordant.
 
     Args:
-        dfs (List[pd.DataFrame]): Unmerged dataframes read directly from files.
+        counts(List[tuple]): list of tuples containing (samplename, filename to open).
+        limit_inputs(int, optional): For testing purposes only, take the first N files. Defaults to None.
+        io_threads(int, optional): number of threads used by `read_counts`. Defaults to None.
+        count_dtype(str, optional): integer dtype to store the counts as. Defaults to "int32".
+        cache_counts(bool, optional): whether `read_counts` uses the parquet cache. Defaults to False.
     """
 
+    if limit_inputs:
+        counts = counts[:limit_inputs]  # pylint: disable=bad-indentation
+
     logger.info("Concordance test has begun.")
-    logger.info("Merging dataframes sequentially.")
-    sequential_df = join_dataframes_sequentially(dfs)
     logger.info("Merging dataframes recursively.")
+    (dfs, _) = read_counts(
+        counts,
+        io_threads=io_threads,
+        count_dtype=count_dtype,
+        cache_counts=cache_counts,
+    )
     recursive_df = join_dataframes_recursively(dfs)
+
+    logger.info("Merging dataframes sequentially.")
+    dfs = []
+    for (sample_name, filename) in _progress_bar(
+        sorted(counts, key=lambda count: count[0]), desc="Reading count files"
+    ):
+        (genes, values) = _read_counts_file(filename, count_dtype)
+        index = pd.Index(_decode_genes(genes), name="Gene Name")
+        dfs.append(pd.DataFrame({sample_name: values}, index=index))
+    sequential_df = functools.reduce(
+        lambda left, right: left.merge(
+            right, how="outer", left_index=True, right_index=True
+        ),
+        _progress_bar(dfs, desc="Merging sequentially"),
+    )
+
+    # an outer merge may order the genes differently, only the counts have to agree.
     logger.info("Asserting concordance between the two matrices.")
-    pd.testing.assert_frame_equal(sequential_df, recursive_df)
+    pd.testing.assert_frame_equal(sequential_df, recursive_df, check_like=True)
     logger.info("Testing completed, result were concordant.")
 
 
@@ -147,61 +431,387 @@ def concordance_test(dfs: List[pd.DataFrame]) -> None:
 #####################
 
 
-def read_counts(
-    counts: List[tuple], limit_inputs: Optional[int] = None,
+def _parse_counts_file(filename: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Parses a single two-column HTSeq counts file without going through the full
+    `pandas.read_csv` machinery. If numba is installed, the file is memory-mapped and
+    parsed by a compiled scanner (see `scanner.py`); otherwise pyarrow's multithreaded
+    CSV reader is used with an explicit schema, so no type inference takes place.
+
+    Args:
+        filename (str): path to the HTSeq counts file.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the gene names (as bytes or str, see
+                                       `_decode_genes`) and the counts respectively.
+    """
+
+    if scanner is not None:
+        return scanner.read_counts_file(filename)
+
+    try:
+        table = pacsv.read_csv(
+            filename,
+            read_options=pacsv.ReadOptions(
+                column_names=["Gene Name", "count"], block_size=1 << 20
+            ),
+            parse_options=pacsv.ParseOptions(delimiter="\t", quote_char=False),
+            # with no null values, an empty or "NA" count is a conversion error
+            # instead of a null that would turn the counts into floats.
+            convert_options=pacsv.ConvertOptions(
+                column_types={"Gene Name": pa.string(), "count": pa.int64()},
+                null_values=[],
+                strings_can_be_null=False,
+            ),
+        )
+    except pa.ArrowInvalid as err:
+        errors.raise_error(
+            f"Unable to parse {filename}. Expected a gene name and a non-negative "
+            + f"integer count separated by a tab on every line ({err}).",
+            suggest_report=False,
+        )
+
+    # blank lines are skipped, so a file can parse without containing any counts.
+    if table.num_rows == 0:
+        errors.raise_error(
+            f"Unable to parse {filename}. The file does not contain any counts.",
+            suggest_report=False,
+        )
+
+    return (
+        table.column("Gene Name").to_numpy(),
+        table.column("count").to_numpy(),
+    )
+
+
+def _read_counts_file(
+    filename: str, count_dtype: str, use_cache: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Reads a single HTSeq counts file. When `use_cache` is set, the parsed file is
+    saved as `<filename>.parquet` and loaded from there on later runs for as long as
+    it is newer than the counts file itself.
+
+    Args:
+        filename (str): path to the HTSeq counts file.
+        count_dtype (str): integer dtype to store the counts as.
+        use_cache (bool, optional): whether to use the parquet cache. Defaults to False.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the gene names (as bytes or str, see
+                                       `_decode_genes`) and the counts respectively.
+    """
+
+    cache_filename = filename + ".parquet"
+    if (
+        use_cache
+        and os.path.exists(cache_filename)
+        and os.path.getmtime(cache_filename) >= os.path.getmtime(filename)
+    ):
+        logger.debug("Cache HIT on parsed counts for file: %s.", filename)
+        table = pq.read_table(cache_filename)
+        genes = table.column("Gene Name").to_numpy()
+        if pa.types.is_binary(table.schema.field("Gene Name").type):
+            genes = genes.astype("S")
+        values = table.column("count").to_numpy()
+    else:
+        genes, values = _parse_counts_file(filename)
+        if use_cache:
+            logger.debug("Cache MISS on parsed counts for file: %s.", filename)
+            table = pa.table({"Gene Name": pa.array(genes), "count": pa.array(values)})
+            try:
+                pq.write_table(table, cache_filename, compression="zstd")
+            except OSError as err:
+                logger.warning("Unable to cache %s: %s", filename, err)
+
+    if values.size > 0 > values.min():
+        errors.raise_error(
+            f"Counts in {filename} must be non-negative integers.",
+            suggest_report=False,
+        )
+
+    # numpy silently wraps integers that overflow the requested dtype, so parse
+    # as int64 and check the range before narrowing.
+    if values.size > 0 and values.max() > np.iinfo(count_dtype).max:
+        errors.raise_error(
+            f"Counts in {filename} do not fit into {count_dtype}. "
+            + "Please rerun with `--count-dtype int64`.",
+            suggest_report=False,
+        )
+
+    return (genes, values.astype(count_dtype))
+
+
+def _decode_genes(genes: np.ndarray) -> np.ndarray:
+    """Decodes gene names returned as bytes by the compiled scanner. Comparing the raw
+    bytes is enough to check whether two files list the same genes, so decoding is
+    deferred until an index actually needs to be built.
+
+    Args:
+        genes (np.ndarray): gene names as returned by `_read_counts_file`.
+
+    Returns:
+        np.ndarray: gene names as str.
+    """
+
+    if genes.dtype.kind == "S":
+        return np.char.decode(genes, "utf-8")
+    return genes
+
+
+def _align_to_index(
+    genes: np.ndarray, values: np.ndarray, gene_index: pd.Index
+) -> Optional[np.ndarray]:
+    """Reorders counts so that they line up with `gene_index`. This only succeeds when
+    `genes` is a permutation of the genes in the index; the lookup reuses the hash
+    table that the index builds once and caches for all subsequent files.
+
+    Args:
+        genes (np.ndarray): gene names in the order they appear in the file.
+        values (np.ndarray): counts in the order they appear in the file.
+        gene_index (pd.Index): the shared gene index to align to.
+
+    Returns:
+        Optional[np.ndarray]: the reordered counts or None if the genes differ.
+    """
+
+    if len(genes) != len(gene_index) or not gene_index.is_unique:
+        return None
+
+    indexer = gene_index.get_indexer(genes)
+    if (indexer < 0).any() or np.unique(indexer).size != indexer.size:
+        return None
+
+    aligned = np.empty_like(values)
+    aligned[indexer] = values
+    return aligned
+
+
+class _SharedMatrix(NamedTuple):
+    """The preallocated matrix that `read_counts` parses files into, along with the
+    genes of the first file that its rows follow."""
+
+    matrix: np.ndarray
+    reference_genes: np.ndarray
+    gene_index: pd.Index
+
+
+class _ParsedFile(NamedTuple):
+    """What `_read_into_matrix` learned about a single counts file."""
+
+    # a randomly chosen (gene, count) pair, see `randomly_sample_coherence_check`.
+    spot_check: Tuple[str, int]
+    # the gene names and counts if they could not be written to the matrix.
+    leftover: Optional[Tuple[np.ndarray, np.ndarray]]
+
+
+def _pick_spot_check(genes: np.ndarray, values: np.ndarray) -> Tuple[str, int]:
+    """Picks a random gene and its count, as parsed from a counts file.
+
+    Args:
+        genes (np.ndarray): gene names as returned by `_read_counts_file`.
+        values (np.ndarray): counts as returned by `_read_counts_file`.
+
+    Returns:
+        Tuple[str, int]: the gene name and its count.
+    """
+
+    row = random.randrange(len(genes))
+    return (_decode_genes(genes[row : row + 1])[0], values[row])
+
+
+def _read_into_matrix(
+    column: int,
+    filename: str,
+    shared: _SharedMatrix,
+    count_dtype: str,
+    use_cache: bool,
+) -> _ParsedFile:
+    """Parses a counts file straight into a column of the shared matrix if its genes
+    line up with the shared gene index. Every call writes to a different column, so
+    this is safe to run from multiple threads. A random gene is picked before the
+    counts are reordered, so that checking it against the merged matrix later on
+    confirms that they ended up in the right place.
+
+    Args:
+        column (int): column of the matrix to write the counts to.
+        filename (str): path to the HTSeq counts file.
+        shared (_SharedMatrix): the preallocated (genes, samples) matrix along with the
+                                genes of the first file, as returned by `_read_counts_file`,
+                                and the shared gene index.
+        count_dtype (str): integer dtype to store the counts as.
+        use_cache (bool): whether to use the parquet cache (see `_read_counts_file`).
+
+    Returns:
+        _ParsedFile: the spot check and, if the counts could not be written to the matrix,
+                     the gene names and counts.
+    """
+
+    genes, values = _read_counts_file(filename, count_dtype, use_cache=use_cache)
+    spot_check = _pick_spot_check(genes, values)
+    if not np.array_equal(genes, shared.reference_genes):
+        genes = _decode_genes(genes)
+        aligned = _align_to_index(genes, values, shared.gene_index)
+        if aligned is None:
+            return _ParsedFile(spot_check=spot_check, leftover=(genes, values))
+        values = aligned
+
+    shared.matrix[:, column] = values
+    return _ParsedFile(spot_check=spot_check, leftover=None)
+
+
+def _assemble_dataframes(
+    shared: _SharedMatrix,
+    counts: List[tuple],
+    leftovers: List[Optional[Tuple[np.ndarray, np.ndarray]]],
 ) -> List[pd.DataFrame]:
-    """Reads dataframes into memory assuming St. Jude Cloud counts files.
+    """Wraps the shared matrix into a dataframe once every file has been parsed into
+    it. A file whose genes could not be lined up with the first file's genes would
+    either grow the matrix or contain duplicate genes when merged, which the merged
+    matrix can never accommodate, so such a file is reported here instead.
+
+    Args:
+        shared (_SharedMatrix): the matrix that the files were parsed into.
+        counts (List[tuple]): (samplename, filename) tuples, in the order of the matrix
+                              columns.
+        leftovers (List[Optional[Tuple[np.ndarray, np.ndarray]]]): what `_read_into_matrix`
+                                                                  returned for each sample.
+
+    Raises:
+        RuntimeError: a file does not contain the same genes as the first one.
+
+    Returns:
+        List[pd.DataFrame]: the matrix of counts sharing the gene index.
+    """
+
+    gene_index = shared.gene_index
+    for ((sample_name, filename), leftover) in zip(counts, leftovers):
+        if leftover is not None:
+            (genes, _) = leftover
+            if len(genes) != len(gene_index):
+                errors.raise_error(
+                    "Dataframe did not conform to expected shape after download! "
+                    + f"Expected: {len(gene_index)} genes, Actual: {len(genes)} genes "
+                    + f"for {sample_name} ({filename}).",
+                    suggest_report=False,
+                )
+            errors.raise_error(
+                f"Counts file {filename} for {sample_name} does not contain the same "
+                + f"genes as {counts[0][1]}, or lists some of them more than once.",
+                suggest_report=False,
+            )
+
+    return [
+        pd.DataFrame(
+            shared.matrix,
+            index=gene_index,
+            columns=[sample_name for (sample_name, _) in counts],
+            copy=False,
+        )
+    ]
+
+
+def read_counts(
+    counts: List[tuple],
+    limit_inputs: Optional[int] = None,
+    io_threads: Optional[int] = None,
+    count_dtype: str = "int32",
+    cache_counts: bool = False,
+) -> Tuple[List[pd.DataFrame], Dict[str, Tuple[str, int]]]:
+    """Reads dataframes into memory assuming St. Jude Cloud counts files. The first
+    file determines the gene index, and every file with the same set of genes
+    (reordering the counts if needed) is parsed straight into a column of a single,
+    preallocated matrix that shares that index. Any file whose genes can't be lined
+    up this way is reported as an error (see `_assemble_dataframes`).
 
     Args:
         counts(List[tuple]): list of tuples containing (samplename, filename to open).
         limit_inputs(int, optional): For testing purposes only, take the first N dataframes. Defaults to None.
+        io_threads(int, optional): number of threads used to read files concurrently. Defaults to None
+                                   (`concurrent.futures.ThreadPoolExecutor`'s default).
+        count_dtype(str, optional): integer dtype to store the counts as. Defaults to "int32".
+        cache_counts(bool, optional): cache parsed files as parquet next to the originals. Defaults to False.
 
     Returns:
-        List[pd.DataFrame]: List of counts as dataframes, one per file.
+        Tuple[List[pd.DataFrame], Dict[str, Tuple[str, int]]]: the matrix of counts sharing the
+                                                               gene index, with the samples sorted
+                                                               by name, and a randomly chosen
+                                                               (gene, count) per sample (see
+                                                               `randomly_sample_coherence_check`).
     """
 
-    dfs: List[pd.DataFrame] = []
     if limit_inputs:
         counts = counts[:limit_inputs]  # pylint: disable=bad-indentation
 
-    for (sample_name, filename) in tqdm.tqdm(
-        counts, desc="Reading count files into memory"
-    ):
-        dataframe = pd.read_csv(filename, sep="\t", header=None)
-        dataframe.columns = ["Gene Name", sample_name]
-        dataframe.set_index("Gene Name", inplace=True)
-        dfs.append(dataframe)
-
-    expected_shape = dfs[0].shape
-    for dataframe in dfs:
-        if dataframe.shape != expected_shape:
-            errors.raise_error(
-                "Dataframe did not conform to expected shape after download! "
-                + f"Expected: {expected_shape}, Actual: {dataframe.shape}."
+    # sorting up front means the merged matrix doesn't need its columns reordered.
+    counts = sorted(counts, key=lambda count: count[0])
+    filenames = [filename for (_, filename) in counts]
+
+    reference_genes, values = _read_counts_file(
+        filenames[0], count_dtype, use_cache=cache_counts
+    )
+    shared = _SharedMatrix(
+        # column-major, so that each file is written to a contiguous block of memory.
+        matrix=np.empty((len(values), len(counts)), dtype=count_dtype, order="F"),
+        reference_genes=reference_genes,
+        gene_index=pd.Index(_decode_genes(reference_genes), name="Gene Name"),
+    )
+    shared.matrix[:, 0] = values
+
+    # `map` yields results in submission order, so the columns stay deterministic.
+    read_into_matrix = functools.partial(
+        _read_into_matrix,
+        shared=shared,
+        count_dtype=count_dtype,
+        use_cache=cache_counts,
+    )
+    with ThreadPoolExecutor(max_workers=io_threads) as executor:
+        parsed = [
+            _ParsedFile(
+                spot_check=_pick_spot_check(reference_genes, values), leftover=None
+            )
+        ] + list(
+            _progress_bar(
+                executor.map(read_into_matrix, range(1, len(counts)), filenames[1:]),
+                total=len(counts),
+                initial=1,
+                desc="Reading count files into memory",
             )
+        )
 
-    return dfs
+    return (
+        _assemble_dataframes(shared, counts, [file.leftover for file in parsed]),
+        {
+            sample_name: file.spot_check
+            for ((sample_name, _), file) in zip(counts, parsed)
+        },
+    )
 
 
 def randomly_sample_coherence_check(
-    dataframes: List[pd.DataFrame], merged: pd.DataFrame
+    counts: List[tuple],
+    merged: pd.DataFrame,
+    count_dtype: str,
+    spot_checks: Optional[Dict[str, Tuple[str, int]]] = None,
+    num_samples: int = 2,
 ):
     """Check that the merged counts matrix looks consistent with the original counts
-    files by looking at a random gene per count file and ensuring it has the same
-    value in the merged matrix. This will catch the majority of bugs that could be
-    introduced into the code in real-time.
+    files. First, the random gene picked per count file while it was parsed (see
+    `read_counts`) must have the same value in the merged matrix, which confirms that
+    every sample's counts ended up in its own column. Then, a few randomly chosen
+    files are parsed again on their own and every gene must have the same value in
+    the merged matrix. This will catch the majority of bugs that could be introduced
+    into the code in real-time.
 
     Args:
-        dataframes (List[pd.DataFrame]): all individual dataframes of HTSeq counts.
+        counts (List[tuple]): list of tuples containing (samplename, filename to open).
         merged (pd.DataFrame): the merged HTSeq count matrix.
+        count_dtype (str): integer dtype the counts were stored as.
+        spot_checks (Dict[str, Tuple[str, int]], optional): a (gene, count) per sample, as
+                                                            returned by `read_counts`.
+                                                            Defaults to None.
+        num_samples (int, optional): number of files to parse again. Defaults to 2.
     """
 
-    for dataframe in dataframes:
-        _sample = dataframe.sample(axis=0)
-        gene = _sample.index.values[0]
-        samplename = _sample.columns.values[0]
-        value_in_individual = _sample.values[0][0]
-
+    for (samplename, (gene, value_in_individual)) in (spot_checks or {}).items():
         value_in_merged = merged[samplename][gene]
         if value_in_individual != value_in_merged:
             errors.raise_error(
@@ -212,27 +822,45 @@ def randomly_sample_coherence_check(
                 + "merged counts matrix. This must be fixed by the developers!"
             )
 
+    samplenames = random.sample(list(merged.columns), min(num_samples, merged.shape[1]))
+    for samplename in samplenames:
+        (genes, values) = _read_counts_file(dict(counts)[samplename], count_dtype)
+        values_in_individual = pd.Series(values, index=_decode_genes(genes))
+        values_in_merged = merged[samplename].reindex(values_in_individual.index)
+        mismatched = values_in_individual.index[
+            values_in_individual.to_numpy() != values_in_merged.to_numpy()
+        ]
 
-def download_and_merge_counts(
-    args: argparse.Namespace, merge_mode: str
-) -> pd.DataFrame:
+        for gene in mismatched[:1]:
+            errors.raise_error(
+                "Found inconsistencies when randomly sampling counts "
+                + f"for coherence. Specifically, {samplename} for gene "
+                + f"{gene} has count {values_in_individual[gene]} in the standalone "
+                + f"HTSeq count file but has value {values_in_merged[gene]} in the "
+                + "merged counts matrix. This must be fixed by the developers!"
+            )
+
+        if len(values_in_individual) != len(merged):
+            errors.raise_error(
+                "Found inconsistencies when randomly sampling counts "
+                + f"for coherence. Specifically, {samplename} has "
+                + f"{len(values_in_individual)} genes in the standalone HTSeq count "
+                + f"file but the merged counts matrix has {len(merged)} genes. "
+                + "This must be fixed by the developers!"
+            )
+
+
+def download_and_merge_counts(args: argparse.Namespace) -> pd.DataFrame:
     """I've decided to pull out the common functionality for downloading and merging
     the counts matrices into this method to keep the subcommand code DRY.
 
     Arguments:
         args (argparse.Namespace): the arguments parsed from the command line.
-        mode (str): one of the allowed values ('sequentially' or 'recursively')
 
     Returns:
         (pd.DataFrame): the merged `pandas.DataFrame`.
     """
 
-    allowed_merge_modes = ["sequential", "recursive"]
-
-    merge_mode = merge_mode.lower()
-    if merge_mode not in [amm.lower() for amm in allowed_merge_modes]:
-        errors.raise_error(f"Unsupported merge_mode provided {merge_mode}.")
-
     download_directory = None
 
     if args.developer_mode:
@@ -255,25 +883,29 @@ def download_and_merge_counts(
         args.cache,
         enable_filesystem_caching=args.developer_mode,
     )
-    dfs = read_counts(files, limit_inputs=args.limit_inputs)
-
-    result = None
-    if merge_mode == "sequential":
-        result = join_dataframes_sequentially(dfs)
-    elif merge_mode == "recursive":
-        result = join_dataframes_recursively(dfs)
+    spot_checks = None
+    if args.engine == "polars":
+        logger.debug("Reading and merging counts files using polars.")
+        result = join_counts_with_polars(
+            files, limit_inputs=args.limit_inputs, count_dtype=args.count_dtype
+        )
     else:
-        errors.raise_error(
-            f"Merging mode in ALLOWED_MERGE_MODES but behavior is not specified: {merge_mode}."
+        (dfs, spot_checks) = read_counts(
+            files,
+            limit_inputs=args.limit_inputs,
+            io_threads=args.io_threads,
+            count_dtype=args.count_dtype,
+            cache_counts=args.cache_counts,
         )
 
-    if result is None:
-        errors.raise_error(f"Result was `None` for merge mode: {merge_mode}.")
+        result = join_dataframes_recursively(dfs)
 
     logger.info(
         "Checking consistency with original counts files with random sampling check."
     )
-    randomly_sample_coherence_check(dfs, result)
+    randomly_sample_coherence_check(
+        files, result, args.count_dtype, spot_checks=spot_checks
+    )
 
     if not args.developer_mode:
         logger.info("Deleting download directory: %s.", download_directory)
@@ -284,3 +916,46 @@ def download_and_merge_counts(
         )
 
     return result
+
+
+######################
+# Writing DataFrames #
+######################
+
+
+def write_delimited(result: pd.DataFrame, output_file: str, delimiter: str) -> None:
+    """Writes a dataframe as delimited text using pyarrow's CSV writer, which formats
+    values in C++ rather than cell by cell in Python like `pandas.DataFrame.to_csv`.
+    The output mirrors `to_csv` for the common case. If any value would need quoting,
+    this falls back to `to_csv` so that the output is still correct.
+
+    Args:
+        result (pd.DataFrame): the dataframe to write.
+        output_file (str): path to the output file.
+        delimiter (str): field delimiter to use.
+    """
+
+    table = pa.Table.from_pandas(result.reset_index(), preserve_index=False)
+
+    # pyarrow always quotes the header, so write it ourselves the way pandas would.
+    header = io.StringIO()
+    csv.writer(header, delimiter=delimiter, lineterminator="\n").writerow(
+        table.column_names
+    )
+
+    try:
+        with open(output_file, "wb") as handle:
+            handle.write(header.getvalue().encode("utf-8"))
+            pacsv.write_csv(
+                table,
+                handle,
+                pacsv.WriteOptions(
+                    include_header=False, delimiter=delimiter, quoting_style="none"
+                ),
+            )
+    except pa.ArrowInvalid:
+        logger.warning(
+            "Some values require quoting, falling back to pandas to write %s.",
+            output_file,
+        )
+        result.to_csv(output_file, sep=delimiter)
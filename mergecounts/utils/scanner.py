@@ -0,0 +1,163 @@
+"""Numba-compiled parser for HTSeq counts files used by the merge-counts command line
+tool. This module is optional: it is only used when numba is installed (see the `numba`
+extra), otherwise pyarrow's CSV reader is used instead.
+"""
+
+import mmap
+import os
+from typing import Tuple
+
+import numpy as np
+import numba  # pylint: disable=import-error
+
+from . import errors
+
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+TAB = ord("\t")
+ZERO = ord("0")
+
+# int64 can hold any 18 digit number, so anything longer is rejected rather than
+# silently overflowing.
+MAX_COUNT_DIGITS = 18
+
+
+@numba.njit(cache=True, nogil=True)
+def _measure(data: np.ndarray) -> int:
+    """Finds the length of the longest gene name in the file. Lines without a tab are
+    measured as a whole: they are malformed, but `_scan` still copies them into
+    `names` before it notices.
+
+    Args:
+        data (np.ndarray): contents of the file as bytes.
+
+    Returns:
+        int: the length of the longest gene name.
+    """
+
+    width = 0
+    length = 0
+    in_gene = True
+    for i in range(data.size):
+        char = data[i]
+        if char == NEWLINE:
+            width = max(width, length)
+            length = 0
+            in_gene = True
+        elif in_gene:
+            if char == TAB:
+                in_gene = False
+            else:
+                length += 1
+    return max(width, length)
+
+
+@numba.njit(cache=True, nogil=True)
+def _scan(data: np.ndarray, names: np.ndarray, values: np.ndarray) -> int:
+    """Walks the file once, copying each gene name into its row of `names` and
+    accumulating each count into `values`. Blank lines are skipped.
+
+    Args:
+        data (np.ndarray): contents of the file as bytes.
+        names (np.ndarray): preallocated (rows, width) array for the gene names.
+        values (np.ndarray): preallocated array for the counts.
+
+    Returns:
+        int: the number of rows parsed or, if the file is malformed, -(line number).
+    """
+
+    row = 0
+    line = 1
+    col = 0
+    digits = 0
+    value = 0
+    in_gene = True
+    for i in range(data.size + 1):
+        char = data[i] if i < data.size else NEWLINE
+        if char == NEWLINE:
+            if in_gene:
+                # only blank lines may lack a count.
+                if col > 0:
+                    return -line
+            elif digits == 0:
+                return -line
+            else:
+                values[row] = value
+                row += 1
+            line += 1
+            col = 0
+            digits = 0
+            value = 0
+            in_gene = True
+        elif char == CARRIAGE_RETURN:
+            continue
+        elif in_gene:
+            if char == TAB:
+                in_gene = False
+            else:
+                names[row, col] = char
+                col += 1
+        else:
+            digit = char - ZERO
+            if digit < 0 or digit > 9 or digits >= MAX_COUNT_DIGITS:
+                return -line
+            value = value * 10 + digit
+            digits += 1
+    return row
+
+
+def read_counts_file(filename: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Parses a two-column HTSeq counts file by memory-mapping it and scanning it with
+    the compiled functions above.
+
+    Args:
+        filename (str): path to the HTSeq counts file.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the gene names (as bytes) and the counts respectively.
+    """
+
+    # mmap can't map an empty file, and there would be nothing to merge anyway.
+    if os.path.getsize(filename) == 0:
+        errors.raise_error(
+            f"Unable to parse {filename}. The file does not contain any counts.",
+            suggest_report=False,
+        )
+
+    with open(filename, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            data = np.frombuffer(buf, dtype=np.uint8)
+            width = max(_measure(data), 1)
+            max_rows = np.count_nonzero(data == NEWLINE) + 1
+            names = np.zeros((max_rows, width), dtype=np.uint8)
+            values = np.empty(max_rows, dtype=np.int64)
+            rows = _scan(data, names, values)
+            # the mmap can't be closed while numpy still holds a view into it.
+            del data
+
+    if rows < 0:
+        errors.raise_error(
+            f"Unable to parse line {-rows} of {filename}. Expected a gene name and "
+            + "a non-negative integer count separated by a tab.",
+            suggest_report=False,
+        )
+    if rows == 0:
+        errors.raise_error(
+            f"Unable to parse {filename}. The file does not contain any counts.",
+            suggest_report=False,
+        )
+
+    genes = names[:rows].view(f"S{width}").ravel()
+
+    # the names are only decoded later on, so check that they are valid UTF-8 here
+    # like pyarrow does. Plain ASCII, by far the common case, needs no decoding.
+    if (names[:rows] >= 0x80).any():
+        try:
+            np.char.decode(genes, "utf-8")
+        except UnicodeDecodeError as err:
+            errors.raise_error(
+                f"Unable to parse {filename}. Gene names must be valid UTF-8 ({err}).",
+                suggest_report=False,
+            )
+
+    return (genes, values[:rows])